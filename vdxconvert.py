@@ -18,13 +18,20 @@ import time
 import shutil
 import logging
 import argparse
+import asyncio
 import platform
 import subprocess
 import csv
+import glob
+import inspect
+import socket
+import tempfile
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from xml.etree import ElementTree as ET
 from pathlib import Path
 import traceback
+from functools import lru_cache, partial
 
 # Try to import optional dependencies
 try:
@@ -32,6 +39,15 @@ try:
     from colorama import Fore, Style
     colorama.init(autoreset=True)
     COLOR_SUPPORT = True
+    
+    # Console log formats per level
+    COLORED_LOG_FORMATS = {
+        logging.DEBUG: Fore.CYAN + '%(message)s' + Style.RESET_ALL,
+        logging.INFO: '%(message)s',
+        logging.WARNING: Fore.YELLOW + '%(message)s' + Style.RESET_ALL,
+        logging.ERROR: Fore.RED + '%(message)s' + Style.RESET_ALL,
+        logging.CRITICAL: Fore.RED + Style.BRIGHT + '%(message)s' + Style.RESET_ALL
+    }
 except ImportError:
     COLOR_SUPPORT = False
 
@@ -41,6 +57,14 @@ try:
 except ImportError:
     PROGRESS_BAR_SUPPORT = False
 
+# Prefer lxml for faster XML construction and serialization
+try:
+    from lxml import etree as ET
+    LXML_SUPPORT = True
+except ImportError:
+    from xml.etree import ElementTree as ET
+    LXML_SUPPORT = False
+
 # Try to import vsdx module
 try:
     import vsdx
@@ -48,15 +72,33 @@ try:
 except ImportError:
     VSDX_SUPPORT = False
 
+# Try to import the LibreOffice UNO bridge (ships with LibreOffice's Python)
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.connection import NoConnectException
+    UNO_SUPPORT = True
+except ImportError:
+    UNO_SUPPORT = False
+
 # Constants
 APP_NAME = "VDXConvert"
 VERSION = "1.0.0"
-SUPPORTED_EXTENSIONS = ['.vsd', '.vsdx', '.vsdm', '.vdw']
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_DIR = os.path.join(SCRIPT_DIR, "input")
 OUTPUT_DIR = os.path.join(SCRIPT_DIR, "output")
 ARCHIVE_DIR = os.path.join(SCRIPT_DIR, "archive")
 LOGS_DIR = os.path.join(SCRIPT_DIR, "logs")
+VDX_NAMESPACE = "http://schemas.microsoft.com/visio/2003/core"
+# Conservative command line length for batch conversions (Windows caps it at 32767)
+MAX_COMMAND_LENGTH = 8000 if sys.platform == "win32" else 100000
+
+if not LXML_SUPPORT:
+    # Serialize the VDX namespace as the default namespace, as lxml does via nsmap
+    ET.register_namespace("", VDX_NAMESPACE)
+
+# Root logger; tracebacks are only formatted when it will emit debug records
+_log = logging.getLogger()
 
 # Configure logger
 def setup_logging(verbose=False):
@@ -88,17 +130,19 @@ def setup_logging(verbose=False):
     if COLOR_SUPPORT:
         # Custom formatter with colors
         class ColoredFormatter(logging.Formatter):
-            formats = {
-                logging.DEBUG: Fore.CYAN + '%(message)s' + Style.RESET_ALL,
-                logging.INFO: '%(message)s',
-                logging.WARNING: Fore.YELLOW + '%(message)s' + Style.RESET_ALL,
-                logging.ERROR: Fore.RED + '%(message)s' + Style.RESET_ALL,
-                logging.CRITICAL: Fore.RED + Style.BRIGHT + '%(message)s' + Style.RESET_ALL
-            }
+            formats = COLORED_LOG_FORMATS
+            
+            def __init__(self):
+                super().__init__('%(message)s')
+                # Build one formatter per level up front instead of per record
+                self._formatters = {
+                    level: logging.Formatter(fmt) for level, fmt in self.formats.items()
+                }
             
             def format(self, record):
-                log_fmt = self.formats.get(record.levelno)
-                formatter = logging.Formatter(log_fmt)
+                formatter = self._formatters.get(record.levelno)
+                if formatter is None:
+                    return super().format(record)
                 return formatter.format(record)
         
         console_handler.setFormatter(ColoredFormatter())
@@ -110,6 +154,24 @@ def setup_logging(verbose=False):
     
     return logger
 
+# Locate external tools
+@lru_cache(maxsize=None)
+def find_soffice():
+    """Locate the LibreOffice executable, or None if it is not installed"""
+    soffice_path = shutil.which("soffice")
+    if soffice_path is None and platform.system() == "Windows":
+        # Try the default LibreOffice install location on Windows
+        program_files = os.environ.get("ProgramFiles", r"C:\Program Files")
+        libreoffice_path = os.path.join(program_files, "LibreOffice", "program", "soffice.exe")
+        if os.path.exists(libreoffice_path):
+            soffice_path = libreoffice_path
+    return soffice_path
+
+@lru_cache(maxsize=None)
+def find_unoconv():
+    """Locate the unoconv executable, or None if it is not installed"""
+    return shutil.which("unoconv")
+
 # Check dependencies
 def check_dependencies():
     """Check if all required dependencies are installed"""
@@ -120,218 +182,506 @@ def check_dependencies():
         missing_deps.append("vsdx")
         logging.warning("vsdx module not found. .vsdx and .vsdm processing will be limited.")
     
-    # Check for unoconv/LibreOffice
-    has_libreoffice = False
-    try:
-        if platform.system() == 'Windows':
-            # Check if LibreOffice is installed on Windows
-            import winreg
-            try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\LibreOffice") as key:
-                    logging.debug("LibreOffice found in registry")
-                    has_libreoffice = True
-            except WindowsError:
-                missing_deps.append("LibreOffice")
-                logging.warning("LibreOffice not found. .vsd and .vdw processing will be limited.")
-        else:
-            # Check for LibreOffice on macOS/Linux
-            try:
-                result = subprocess.run(
-                    ["which", "soffice"], 
-                    stdout=subprocess.PIPE, 
-                    stderr=subprocess.PIPE, 
-                    text=True, 
-                    check=True
-                )
-                if result.stdout:
-                    logging.debug(f"LibreOffice found at: {result.stdout.strip()}")
-                    has_libreoffice = True
-            except (subprocess.SubprocessError, FileNotFoundError):
-                missing_deps.append("LibreOffice")
-                logging.warning("LibreOffice not found. .vsd and .vdw processing will be limited.")
-    except Exception as e:
-        logging.error(f"Error checking for LibreOffice: {str(e)}")
+    # Check for LibreOffice
+    soffice_path = find_soffice()
+    if soffice_path:
+        logging.debug(f"LibreOffice found at: {soffice_path}")
+    else:
+        missing_deps.append("LibreOffice")
+        logging.warning("LibreOffice not found. .vsd and .vdw processing will be limited.")
     
     # Check for unoconv
-    has_unoconv = False
-    try:
-        result = subprocess.run(
-            ["which" if platform.system() != "Windows" else "where", "unoconv"], 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE, 
-            text=True
-        )
-        if result.returncode == 0:
-            logging.debug(f"unoconv found at: {result.stdout.strip()}")
-            has_unoconv = True
-        else:
-            missing_deps.append("unoconv")
-            logging.warning("unoconv not found. .vsd and .vdw processing will be limited.")
-    except (subprocess.SubprocessError, FileNotFoundError):
+    unoconv_path = find_unoconv()
+    if unoconv_path:
+        logging.debug(f"unoconv found at: {unoconv_path}")
+    else:
         missing_deps.append("unoconv")
         logging.warning("unoconv not found. .vsd and .vdw processing will be limited.")
     
     # Return overall LibreOffice/unoconv support status
-    vsd_support = has_libreoffice or has_unoconv
+    vsd_support = bool(soffice_path or unoconv_path)
     
     return VSDX_SUPPORT, vsd_support, missing_deps
 
 # File handling functions
 def get_visio_files(directory):
     """Get a list of Visio files in the given directory"""
-    files = []
-    for filename in os.listdir(directory):
-        filepath = os.path.join(directory, filename)
-        if os.path.isfile(filepath):
-            _, ext = os.path.splitext(filename.lower())
-            if ext in SUPPORTED_EXTENSIONS:
-                files.append(filepath)
-    return files
-
-def get_unique_filename(filepath):
-    """Generate a unique filename if file already exists"""
-    if not os.path.exists(filepath):
-        return filepath
-    
-    directory, filename = os.path.split(filepath)
-    name, ext = os.path.splitext(filename)
+    # scandir entries cache file type info, avoiding an extra stat per file
+    with os.scandir(directory) as entries:
+        return [entry.path for entry in entries
+                if entry.name.lower().endswith(SUPPORTED_EXTENSIONS) and entry.is_file()]
+
+def get_used_names(directory):
+    """Get the lowercased names of all entries in a directory"""
+    # Compared case-insensitively so Windows/macOS never see a clash
+    with os.scandir(directory) as entries:
+        return {entry.name.lower() for entry in entries}
+
+def get_converted_filenames():
+    """Get the lowercased names of files the latest CSV report lists as converted"""
+    reports = glob.glob(os.path.join(LOGS_DIR, "conversion_report_*.csv"))
+    if not reports:
+        return set()
     
+    # Report names embed a sortable timestamp, so the newest sorts last
+    latest_report = max(reports)
+    try:
+        with open(latest_report, newline='', encoding='utf-8') as csvfile:
+            return {row["filename"].lower() for row in csv.DictReader(csvfile)
+                    if row.get("success") == "True" and row.get("filename")}
+    except (OSError, csv.Error) as e:
+        logging.warning(f"Could not read previous report {latest_report}: {str(e)}")
+        return set()
+
+def _next_free(name, ext, directory, used_set):
+    """Pick the first unused "name[_N]ext" in directory and mark it as used"""
+    candidate = f"{name}{ext}"
     counter = 1
-    while True:
-        new_filepath = os.path.join(directory, f"{name}_{counter}{ext}")
-        if not os.path.exists(new_filepath):
-            return new_filepath
+    while candidate.lower() in used_set:
+        candidate = f"{name}_{counter}{ext}"
         counter += 1
+    
+    used_set.add(candidate.lower())
+    return os.path.join(directory, candidate)
+
+def get_target_paths(input_file, used_names):
+    """Reserve unique output and archive paths for an input file"""
+    filename = os.path.basename(input_file)
+    base_name, ext = os.path.splitext(filename)
+    
+    output_file = _next_free(base_name, ".vdx", OUTPUT_DIR, used_names[OUTPUT_DIR])
+    archive_file = _next_free(base_name, ext, ARCHIVE_DIR, used_names[ARCHIVE_DIR])
+    
+    return output_file, archive_file
 
 # Conversion functions
+def vdx_tag(tag):
+    """Qualify a tag name with the VDX namespace"""
+    return f"{{{VDX_NAMESPACE}}}{tag}"
+
+# Qualified VDX tag names, built once instead of per element
+TAG_VISIO_DOCUMENT = vdx_tag("VisioDocument")
+TAG_DOCUMENT_PROPERTIES = vdx_tag("DocumentProperties")
+TAG_TITLE = vdx_tag("Title")
+TAG_CREATOR = vdx_tag("Creator")
+TAG_PAGES = vdx_tag("Pages")
+TAG_PAGE = vdx_tag("Page")
+TAG_PAGE_PROPERTIES = vdx_tag("PageProperties")
+TAG_PAGE_WIDTH = vdx_tag("PageWidth")
+TAG_PAGE_HEIGHT = vdx_tag("PageHeight")
+TAG_SHAPES = vdx_tag("Shapes")
+TAG_SHAPE = vdx_tag("Shape")
+TAG_SHAPE_PROPERTIES = vdx_tag("ShapeProperties")
+TAG_POS_X = vdx_tag("PosX")
+TAG_POS_Y = vdx_tag("PosY")
+TAG_WIDTH = vdx_tag("Width")
+TAG_HEIGHT = vdx_tag("Height")
+
+def write_vdx_value(element, write, tag, value):
+    """Write a single text element using a streaming writer's element/write"""
+    with element(tag):
+        write(str(value))
+
+def write_vdx_page(xf, idx, page):
+    """Stream a single page and its shapes to a VDX writer"""
+    element = xf.element
+    write = xf.write
+    with element(TAG_PAGE, ID=str(idx), Name=page.name):
+        # Write page properties
+        with element(TAG_PAGE_PROPERTIES):
+            write_vdx_value(element, write, TAG_PAGE_WIDTH, page.width)
+            write_vdx_value(element, write, TAG_PAGE_HEIGHT, page.height)
+        
+        # Write shapes, reading each shape property once via getattr rather than
+        # hasattr followed by a second lookup
+        with element(TAG_SHAPES):
+            for shape_id, shape in enumerate(page.shapes, 1):
+                name = getattr(shape, 'name', None) or f"Shape_{shape_id}"
+                x = getattr(shape, 'x', None)
+                y = getattr(shape, 'y', None)
+                width = getattr(shape, 'width', None)
+                height = getattr(shape, 'height', None)
+                
+                with element(TAG_SHAPE, ID=str(shape_id), Name=name):
+                    with element(TAG_SHAPE_PROPERTIES):
+                        # Write position and size
+                        if x is not None and y is not None:
+                            write_vdx_value(element, write, TAG_POS_X, x)
+                            write_vdx_value(element, write, TAG_POS_Y, y)
+                        
+                        if width is not None and height is not None:
+                            write_vdx_value(element, write, TAG_WIDTH, width)
+                            write_vdx_value(element, write, TAG_HEIGHT, height)
+
+def write_vdx_stream(drawing, title, output_file):
+    """Stream a VDX document to disk page by page using lxml"""
+    with ET.xmlfile(output_file, encoding="utf-8") as xf:
+        xf.write_declaration()
+        with xf.element(TAG_VISIO_DOCUMENT, nsmap={None: VDX_NAMESPACE}):
+            # Write document properties
+            with xf.element(TAG_DOCUMENT_PROPERTIES):
+                write_vdx_value(xf.element, xf.write, TAG_TITLE, title)
+                write_vdx_value(xf.element, xf.write, TAG_CREATOR, "VDXConvert")
+            
+            # Write each page in the Visio document
+            with xf.element(TAG_PAGES):
+                for idx, page in enumerate(drawing.pages, 1):
+                    write_vdx_page(xf, idx, page)
+
+def write_vdx_tree(drawing, title, output_file):
+    """Build a VDX document in memory and write it to disk (stdlib fallback)"""
+    SubElement = ET.SubElement
+    vdx_root = ET.Element(TAG_VISIO_DOCUMENT)
+    
+    # Extract document properties
+    doc_props = SubElement(vdx_root, TAG_DOCUMENT_PROPERTIES)
+    title_elem = SubElement(doc_props, TAG_TITLE)
+    title_elem.text = title
+    creator = SubElement(doc_props, TAG_CREATOR)
+    creator.text = "VDXConvert"
+    
+    # Extract pages
+    pages = SubElement(vdx_root, TAG_PAGES)
+    
+    # Process each page in the Visio document
+    for idx, page in enumerate(drawing.pages, 1):
+        page_elem = SubElement(pages, TAG_PAGE, ID=str(idx))
+        page_elem.set("Name", page.name)
+        
+        # Add page properties
+        page_props = SubElement(page_elem, TAG_PAGE_PROPERTIES)
+        width = SubElement(page_props, TAG_PAGE_WIDTH)
+        width.text = str(page.width)
+        height = SubElement(page_props, TAG_PAGE_HEIGHT)
+        height.text = str(page.height)
+        
+        # Add shapes
+        shapes = SubElement(page_elem, TAG_SHAPES)
+        for shape_id, shape in enumerate(page.shapes, 1):
+            x = getattr(shape, 'x', None)
+            y = getattr(shape, 'y', None)
+            width = getattr(shape, 'width', None)
+            height = getattr(shape, 'height', None)
+            
+            shape_elem = SubElement(shapes, TAG_SHAPE, ID=str(shape_id))
+            shape_elem.set("Name", getattr(shape, 'name', None) or f"Shape_{shape_id}")
+            
+            # Add shape properties
+            shape_props = SubElement(shape_elem, TAG_SHAPE_PROPERTIES)
+            
+            # Add position and size
+            if x is not None and y is not None:
+                SubElement(shape_props, TAG_POS_X).text = str(x)
+                SubElement(shape_props, TAG_POS_Y).text = str(y)
+            
+            if width is not None and height is not None:
+                SubElement(shape_props, TAG_WIDTH).text = str(width)
+                SubElement(shape_props, TAG_HEIGHT).text = str(height)
+    
+    # Create XML tree and write to file
+    tree = ET.ElementTree(vdx_root)
+    tree.write(output_file, encoding="utf-8", xml_declaration=True)
+
 def convert_vsdx_to_vdx(input_file, output_file):
     """Convert .vsdx or .vsdm file to .vdx format using vsdx library"""
     if not VSDX_SUPPORT:
         raise ImportError("vsdx library is required for processing .vsdx files")
     
     try:
-        drawing = vsdx.VisioFile(input_file)
-        
-        # Create VDX XML structure
-        vdx_root = ET.Element("VisioDocument", 
-                              xmlns="http://schemas.microsoft.com/visio/2003/core")
-        
-        # Extract document properties
-        doc_props = ET.SubElement(vdx_root, "DocumentProperties")
-        title = ET.SubElement(doc_props, "Title")
-        title.text = os.path.basename(input_file)
-        creator = ET.SubElement(doc_props, "Creator")
-        creator.text = "VDXConvert"
-        
-        # Extract pages
-        pages = ET.SubElement(vdx_root, "Pages")
-        
-        # Process each page in the Visio document
-        for idx, page in enumerate(drawing.pages, 1):
-            page_elem = ET.SubElement(pages, "Page", ID=str(idx))
-            page_elem.set("Name", page.name)
-            
-            # Add page properties
-            page_props = ET.SubElement(page_elem, "PageProperties")
-            width = ET.SubElement(page_props, "PageWidth")
-            width.text = str(page.width)
-            height = ET.SubElement(page_props, "PageHeight")
-            height.text = str(page.height)
-            
-            # Add shapes
-            shapes = ET.SubElement(page_elem, "Shapes")
-            for shape_id, shape in enumerate(page.shapes, 1):
-                shape_elem = ET.SubElement(shapes, "Shape", ID=str(shape_id))
-                shape_elem.set("Name", shape.name if shape.name else f"Shape_{shape_id}")
-                
-                # Add shape properties
-                shape_props = ET.SubElement(shape_elem, "ShapeProperties")
-                
-                # Add position and size
-                if hasattr(shape, 'x') and hasattr(shape, 'y'):
-                    pos_x = ET.SubElement(shape_props, "PosX")
-                    pos_x.text = str(shape.x)
-                    pos_y = ET.SubElement(shape_props, "PosY")
-                    pos_y.text = str(shape.y)
-                
-                if hasattr(shape, 'width') and hasattr(shape, 'height'):
-                    width = ET.SubElement(shape_props, "Width")
-                    width.text = str(shape.width)
-                    height = ET.SubElement(shape_props, "Height")
-                    height.text = str(shape.height)
+        title = os.path.basename(input_file)
         
-        # Create XML tree and write to file
-        tree = ET.ElementTree(vdx_root)
-        tree.write(output_file, encoding="utf-8", xml_declaration=True)
+        # VisioFile extracts the package to a temp directory; the context
+        # manager removes it once the document has been written
+        with vsdx.VisioFile(input_file) as drawing:
+            # Stream the document when lxml is available to keep memory flat
+            if LXML_SUPPORT:
+                write_vdx_stream(drawing, title, output_file)
+            else:
+                write_vdx_tree(drawing, title, output_file)
         
         return True
     except Exception as e:
         logging.error(f"Error converting {input_file} to VDX: {str(e)}")
-        logging.debug(traceback.format_exc())
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(traceback.format_exc())
+
+        # Don't leave a partially streamed document behind
+        if os.path.exists(output_file):
+            os.remove(output_file)
         return False
 
-def convert_vsd_to_vdx(input_file, output_file):
+class _LibreOfficeServer:
+    """Headless LibreOffice instance kept running and driven over UNO"""
+    
+    def __init__(self, timeout=60):
+        self.timeout = timeout
+        self.process = None
+        self.desktop = None
+        self.profile_dir = None
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+    
+    @staticmethod
+    def _find_free_port():
+        """Ask the OS for a free local port for the UNO socket"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("localhost", 0))
+            return sock.getsockname()[1]
+    
+    def start(self):
+        """Launch soffice with a UNO socket and connect to its desktop"""
+        port = self._find_free_port()
+        connection = f"socket,host=localhost,port={port};urp;"
+        try:
+            self.profile_dir = tempfile.mkdtemp(prefix="vdxconvert_", dir=LOGS_DIR)
+        
+            logging.debug(f"Starting LibreOffice server on port {port}")
+            self.process = subprocess.Popen(
+                [
+                    find_soffice() or "soffice",
+                    "--headless",
+                    "--invisible",
+                    "--nologo",
+                    "--norestore",
+                    f"-env:UserInstallation={Path(self.profile_dir).as_uri()}",
+                    f"--accept={connection}"
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=False
+            )
+        
+            # Wait for soffice to bind the socket
+            local_context = uno.getComponentContext()
+            resolver = local_context.ServiceManager.createInstanceWithContext(
+                "com.sun.star.bridge.UnoUrlResolver", local_context)
+            deadline = time.time() + self.timeout
+            while True:
+                try:
+                    context = resolver.resolve(f"uno:{connection}StarOffice.ComponentContext")
+                    break
+                except NoConnectException:
+                    if self.process.poll() is not None or time.time() > deadline:
+                        raise RuntimeError("LibreOffice server did not start")
+                    time.sleep(0.5)
+        
+            self.desktop = context.ServiceManager.createInstanceWithContext(
+                "com.sun.star.frame.Desktop", context)
+        except BaseException:
+            # __exit__ never runs when __enter__ raises, so clean up here
+            self.stop()
+            raise
+    
+    def convert(self, input_path, output_path):
+        """Convert a single document to VDX using the running server"""
+        input_url = uno.systemPathToFileUrl(os.path.abspath(input_path))
+        output_url = uno.systemPathToFileUrl(os.path.abspath(output_path))
+        
+        doc = self.desktop.loadComponentFromURL(
+            input_url, "_blank", 0, (PropertyValue(Name="Hidden", Value=True),))
+        if doc is None:
+            raise RuntimeError(f"LibreOffice could not open {input_path}")
+        
+        try:
+            doc.storeToURL(output_url, (PropertyValue(Name="FilterName", Value="VDX"),))
+        finally:
+            doc.close(True)
+    
+    def stop(self):
+        """Shut down the server and remove its profile directory"""
+        if self.desktop is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                # The bridge is torn down as soffice exits
+                pass
+            self.desktop = None
+        
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+        
+        if self.profile_dir is not None:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+            self.profile_dir = None
+
+def convert_vsd_with_server(input_files, output_dir):
+    """Convert .vsd/.vdw files through one persistent LibreOffice server
+    
+    Returns the same mapping as convert_vsd_batch. Raises if the server
+    cannot be started.
+    """
+    converted = {}
+    with _LibreOfficeServer() as server:
+        for idx, input_file in enumerate(input_files, 1):
+            # Prefix with the index so inputs sharing a base name don't collide
+            base_name = os.path.splitext(os.path.basename(input_file))[0]
+            temp_vdx = os.path.join(output_dir, f"{idx}_{base_name}.vdx")
+            try:
+                server.convert(input_file, temp_vdx)
+                if os.path.exists(temp_vdx):
+                    converted[input_file] = temp_vdx
+            except Exception as e:
+                logging.debug(f"LibreOffice server failed to convert {input_file}: {str(e)}")
+    return converted
+
+def convert_vsd_batch(input_files, output_dir):
+    """Convert several .vsd/.vdw files with a single unoconv/LibreOffice launch
+    
+    Returns a mapping of each converted input file to the VDX file produced
+    in output_dir. Files missing from the mapping were not converted.
+    """
+    # Inputs sharing a base name would overwrite each other in output_dir, so
+    # only the first of each is batched and the rest are left for a retry
+    batch = {}
+    for input_file in input_files:
+        base_name = os.path.splitext(os.path.basename(input_file))[0]
+        batch.setdefault(base_name.lower(), (base_name, input_file))
+    
+    commands = [
+        ("unoconv", [find_unoconv() or "unoconv", "-f", "vdx", "-o", output_dir]),
+        ("LibreOffice", [
+            find_soffice() or "soffice",
+            "--headless",
+            f"-env:UserInstallation={Path(output_dir, 'profile').as_uri()}",
+            "--convert-to", "vdx",
+            "--outdir", output_dir
+        ])
+    ]
+    
+    converted = {}
+    for tool, convert_cmd in commands:
+        pending = [input_file for _, input_file in batch.values() if input_file not in converted]
+        if not pending:
+            break
+        
+        # Split the inputs so each launch stays below the command line limit
+        chunks = [[]]
+        length = budget = MAX_COMMAND_LENGTH - sum(len(arg) + 1 for arg in convert_cmd)
+        for input_file in pending:
+            if chunks[-1] and length < len(input_file) + 1:
+                chunks.append([])
+                length = budget
+            chunks[-1].append(input_file)
+            length -= len(input_file) + 1
+        
+        # A single bad file fails the whole run, so check outputs rather than the exit code
+        for chunk in chunks:
+            logging.debug(f"Attempting batch conversion of {len(chunk)} files with {tool}")
+            try:
+                subprocess.run(
+                    convert_cmd + chunk,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    close_fds=False
+                )
+            except (subprocess.SubprocessError, OSError) as e:
+                # Failed launches leave their files to the per-file fallback
+                logging.debug(f"{tool} batch conversion failed: {str(e)}")
+        
+        # Match the produced VDX files back to their inputs
+        for base_name, input_file in batch.values():
+            temp_vdx = os.path.join(output_dir, f"{base_name}.vdx")
+            if input_file not in converted and os.path.exists(temp_vdx):
+                converted[input_file] = temp_vdx
+    
+    return converted
+
+async def run_converter(convert_cmd):
+    """Run a conversion command without blocking the event loop"""
+    process = await asyncio.create_subprocess_exec(
+        *convert_cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        close_fds=False
+    )
+    _, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, convert_cmd, stderr=stderr)
+
+# unoconv talks to a single listener on a fixed port, so concurrent calls
+# clash; one lock per event loop serializes them
+_UNOCONV_LOCKS = weakref.WeakKeyDictionary()
+
+def get_unoconv_lock():
+    """Get the lock that serializes unoconv calls on the running event loop"""
+    loop = asyncio.get_running_loop()
+    lock = _UNOCONV_LOCKS.get(loop)
+    if lock is None:
+        lock = _UNOCONV_LOCKS[loop] = asyncio.Lock()
+    return lock
+
+async def convert_vsd_to_vdx(input_file, output_file):
     """Convert .vsd or .vdw file to .vdx format using unoconv/LibreOffice"""
+    # Private temporary directory so parallel conversions don't collide,
+    # created only if the conversion needs to stage files or a profile
+    temp_dir = None
+    # Set when the converter writes into the output folder directly
+    direct_vdx = None
+    converted = False
+    
     try:
-        # Create a temporary directory for conversion
-        temp_dir = os.path.join(LOGS_DIR, "temp")
-        os.makedirs(temp_dir, exist_ok=True)
-        
         # Get base filename without extension
         base_name = os.path.splitext(os.path.basename(input_file))[0]
         
+        # Convert straight into the output folder when the target keeps the
+        # input's name; otherwise stage in temp_dir and rename into place
+        if os.path.basename(output_file) == f"{base_name}.vdx":
+            convert_dir = os.path.dirname(output_file)
+            direct_vdx = output_file
+        else:
+            temp_dir = tempfile.mkdtemp(prefix="vdxconvert_", dir=LOGS_DIR)
+            convert_dir = temp_dir
+        converted_vdx = os.path.join(convert_dir, f"{base_name}.vdx")
+        
         # Try unoconv first (better conversion quality)
         try:
             logging.debug(f"Attempting conversion with unoconv: {input_file}")
-            subprocess.run(
-                ["unoconv", "-f", "vdx", "-o", temp_dir, input_file],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=True
-            )
+            async with get_unoconv_lock():
+                await run_converter(
+                    [find_unoconv() or "unoconv", "-f", "vdx", "-o", convert_dir, input_file]
+                )
             
             # Check if the VDX file was created
-            temp_vdx = os.path.join(temp_dir, f"{base_name}.vdx")
-            if os.path.exists(temp_vdx):
-                shutil.copy2(temp_vdx, output_file)
-                os.remove(temp_vdx)
+            if os.path.exists(converted_vdx):
+                if converted_vdx != output_file:
+                    shutil.move(converted_vdx, output_file)
+                converted = True
                 return True
         except (subprocess.SubprocessError, FileNotFoundError) as e:
             logging.debug(f"unoconv conversion failed: {str(e)}")
         
         # Try direct LibreOffice conversion as fallback
         try:
-            soffice_cmd = "soffice"
-            if platform.system() == "Windows":
-                # Try to find LibreOffice executable on Windows
-                program_files = os.environ.get("ProgramFiles", r"C:\Program Files")
-                libreoffice_path = os.path.join(program_files, "LibreOffice", "program", "soffice.exe")
-                if os.path.exists(libreoffice_path):
-                    soffice_cmd = f'"{libreoffice_path}"'
-            
             logging.debug(f"Attempting conversion with LibreOffice: {input_file}")
+            if temp_dir is None:
+                temp_dir = tempfile.mkdtemp(prefix="vdxconvert_", dir=LOGS_DIR)
             convert_cmd = [
-                soffice_cmd,
+                find_soffice() or "soffice",
                 "--headless",
+                f"-env:UserInstallation={Path(temp_dir, 'profile').as_uri()}",
                 "--convert-to", "vdx",
-                "--outdir", temp_dir,
+                "--outdir", convert_dir,
                 input_file
             ]
             
-            subprocess.run(
-                convert_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=True
-            )
+            await run_converter(convert_cmd)
             
             # Check if the VDX file was created
-            temp_vdx = os.path.join(temp_dir, f"{base_name}.vdx")
-            if os.path.exists(temp_vdx):
-                shutil.copy2(temp_vdx, output_file)
-                os.remove(temp_vdx)
+            if os.path.exists(converted_vdx):
+                if converted_vdx != output_file:
+                    shutil.move(converted_vdx, output_file)
+                converted = True
                 return True
         except (subprocess.SubprocessError, FileNotFoundError) as e:
             logging.debug(f"LibreOffice conversion failed: {str(e)}")
@@ -342,32 +692,95 @@ def convert_vsd_to_vdx(input_file, output_file):
         return False
     except Exception as e:
         logging.error(f"Error during VSD to VDX conversion: {str(e)}")
-        logging.debug(traceback.format_exc())
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(traceback.format_exc())
         return False
     finally:
+        # Don't leave partial output from a failed direct conversion behind
+        if not converted and direct_vdx is not None and os.path.exists(direct_vdx):
+            os.remove(direct_vdx)
+        
         # Clean up temp directory
-        temp_dir = os.path.join(LOGS_DIR, "temp")
-        if os.path.exists(temp_dir):
-            try:
-                shutil.rmtree(temp_dir)
-            except:
-                pass
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
-def process_file(input_file, vsdx_support, vsd_support):
-    """Process a single Visio file and convert it to VDX format"""
+# Converter for each supported extension
+_CONVERTERS = {
+    '.vsd': convert_vsd_to_vdx,
+    '.vsdx': convert_vsdx_to_vdx,
+    '.vsdm': convert_vsdx_to_vdx,
+    '.vdw': convert_vsd_to_vdx
+}
+SUPPORTED_EXTENSIONS = tuple(_CONVERTERS)
+VSD_EXTENSIONS = tuple(ext for ext, converter in _CONVERTERS.items()
+                       if converter is convert_vsd_to_vdx)
+
+def finalize_conversion(input_file, output_file, archive_file, success, processing_time):
+    """Archive the original file on success and build its result entry"""
     filename = os.path.basename(input_file)
-    base_name, ext = os.path.splitext(filename)
-    ext = ext.lower()
     
-    start_time = time.time()
+    # Move original file to archive on success
+    if success:
+        shutil.move(input_file, archive_file)
+        logging.info(f"✅ Conversion successful: {os.path.basename(output_file)} ({processing_time:.2f}s)")
+        return {
+            "filename": filename,
+            "output": os.path.basename(output_file),
+            "archive": os.path.basename(archive_file),
+            "success": True,
+            "time": processing_time,
+            "error": None
+        }
+    else:
+        logging.error(f"❌ Conversion failed: {filename}")
+        return {
+            "filename": filename,
+            "output": None,
+            "archive": None,
+            "success": False,
+            "time": processing_time,
+            "error": "Conversion process failed"
+        }
+
+def get_converter(ext, vsdx_support, vsd_support):
+    """Get the converter for a file extension, or None if it can't be used"""
+    converter = _CONVERTERS.get(ext)
+    if converter is None:
+        logging.error(f"Unsupported file extension: {ext}")
+    elif converter is convert_vsdx_to_vdx and not vsdx_support:
+        logging.error(f"Cannot process {ext} files: vsdx library not available")
+    elif converter is convert_vsd_to_vdx and not vsd_support:
+        logging.error(f"Cannot process {ext} files: LibreOffice/unoconv not available")
+    else:
+        return converter
+    return None
+
+def error_result(input_file, processing_time, error):
+    """Log an unexpected processing error and build its result entry"""
+    filename = os.path.basename(input_file)
+    logging.error(f"❌ Error processing {filename}: {str(error)}")
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug(traceback.format_exc())
+    return {
+        "filename": filename,
+        "output": None,
+        "archive": None,
+        "success": False,
+        "time": processing_time,
+        "error": str(error)
+    }
+
+def process_file(input_file, output_file, archive_file, vsdx_support, vsd_support, run=asyncio.run):
+    """Process a single Visio file and convert it to VDX format
     
-    # Create output filename
-    output_file = os.path.join(OUTPUT_DIR, f"{base_name}.vdx")
-    output_file = get_unique_filename(output_file)
+    Asynchronous converters are executed with run, which defaults to a
+    fresh event loop; callers on a worker thread can hand them back to
+    their own loop instead.
+    """
+    filename = os.path.basename(input_file)
+    ext = os.path.splitext(filename)[1].lower()
     
-    # Create archive filename
-    archive_file = os.path.join(ARCHIVE_DIR, filename)
-    archive_file = get_unique_filename(archive_file)
+    start_time = time.time()
     
     logging.info(f"Processing: {filename}")
     
@@ -375,67 +788,162 @@ def process_file(input_file, vsdx_support, vsd_support):
         success = False
         
         # Process based on file extension
-        if ext in ['.vsdx', '.vsdm']:
-            if vsdx_support:
-                success = convert_vsdx_to_vdx(input_file, output_file)
-            else:
-                logging.error(f"Cannot process {ext} files: vsdx library not available")
-        elif ext in ['.vsd', '.vdw']:
-            if vsd_support:
-                success = convert_vsd_to_vdx(input_file, output_file)
+        converter = get_converter(ext, vsdx_support, vsd_support)
+        if converter is not None:
+            if inspect.iscoroutinefunction(converter):
+                success = run(converter(input_file, output_file))
             else:
-                logging.error(f"Cannot process {ext} files: LibreOffice/unoconv not available")
-        else:
-            logging.error(f"Unsupported file extension: {ext}")
-        
-        end_time = time.time()
-        processing_time = end_time - start_time
-        
-        # Move original file to archive on success
-        if success:
-            shutil.move(input_file, archive_file)
-            logging.info(f"✅ Conversion successful: {os.path.basename(output_file)} ({processing_time:.2f}s)")
-            return {
-                "filename": filename,
-                "output": os.path.basename(output_file),
-                "archive": os.path.basename(archive_file),
-                "success": True,
-                "time": processing_time,
-                "error": None
-            }
-        else:
-            logging.error(f"❌ Conversion failed: {filename}")
-            return {
-                "filename": filename,
-                "output": None,
-                "archive": None,
-                "success": False,
-                "time": processing_time,
-                "error": "Conversion process failed"
-            }
+                success = converter(input_file, output_file)
+        
+        processing_time = time.time() - start_time
+        return finalize_conversion(input_file, output_file, archive_file, success, processing_time)
     except Exception as e:
-        end_time = time.time()
-        processing_time = end_time - start_time
-        logging.error(f"❌ Error processing {filename}: {str(e)}")
-        logging.debug(traceback.format_exc())
-        return {
-            "filename": filename,
-            "output": None,
-            "archive": None,
-            "success": False,
-            "time": processing_time,
-            "error": str(e)
-        }
+        return error_result(input_file, time.time() - start_time, e)
+
+def init_worker(verbose):
+    """Configure logging in a worker process"""
+    setup_logging(verbose)
+
+def process_vsd_batch(input_files, targets):
+    """Convert .vsd/.vdw files in batches and archive the successful ones
+    
+    Returns the result entries for converted files and the list of input
+    files that still need a per-file conversion attempt.
+    """
+    # Files sharing a base name are left out of the batch and retried one by one
+    batch_size = len({os.path.splitext(os.path.basename(f))[0].lower() for f in input_files})
+    logging.info(f"Batch converting {batch_size} of {len(input_files)} VSD/VDW files")
+    start_time = time.time()
+    temp_dir = tempfile.mkdtemp(prefix="vdxconvert_", dir=LOGS_DIR)
+    
+    try:
+        # Prefer a persistent UNO server; otherwise launch the command line tools once
+        converted = None
+        if UNO_SUPPORT:
+            try:
+                converted = convert_vsd_with_server(input_files, temp_dir)
+            except Exception as e:
+                logging.debug(f"LibreOffice server unavailable: {str(e)}")
+        if converted is None:
+            converted = convert_vsd_batch(input_files, temp_dir)
+        
+        # Share the batch time evenly so summary totals stay meaningful
+        processing_time = (time.time() - start_time) / len(input_files)
+        
+        results = {}
+        for input_file, temp_vdx in converted.items():
+            output_file, archive_file = targets[input_file]
+            try:
+                shutil.move(temp_vdx, output_file)
+                results[input_file] = finalize_conversion(input_file, output_file, archive_file,
+                                                          True, processing_time)
+            except Exception as e:
+                logging.debug(f"Could not finalize batch conversion of {input_file}: {str(e)}")
+        
+        failed = [input_file for input_file in input_files if input_file not in results]
+        return results, failed
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def process_files(visio_files, used_names, vsdx_support, vsd_support, verbose=False):
+    """Process Visio files in parallel, returning results in input order
+    
+    used_names maps OUTPUT_DIR and ARCHIVE_DIR to the sets of names already
+    taken in them; it is updated with the names reserved here.
+    """
+    # Reserve target paths up front so workers never pick the same name
+    targets = {input_file: get_target_paths(input_file, used_names) for input_file in visio_files}
+    
+    # A single file gains nothing from a worker pool or a batched launch
+    if len(visio_files) == 1:
+        input_file = visio_files[0]
+        return [process_file(input_file, *targets[input_file], vsdx_support, vsd_support)]
+    
+    return asyncio.run(process_files_async(visio_files, targets, vsdx_support, vsd_support, verbose))
+
+async def process_files_async(visio_files, targets, vsdx_support, vsd_support, verbose=False):
+    """Run pool, batch and per-file conversions concurrently on one event loop"""
+    loop = asyncio.get_running_loop()
+    
+    # VSD/VDW files share one LibreOffice launch; everything else goes to the pool
+    vsd_files = []
+    pool_files = []
+    for input_file in visio_files:
+        if vsd_support and os.path.splitext(input_file)[1].lower() in VSD_EXTENSIONS:
+            vsd_files.append(input_file)
+        else:
+            pool_files.append(input_file)
+    
+    results = {}
+    progress = None
+    
+    # Pool workers and unoconv/LibreOffice processes share one CPU budget,
+    # split evenly when there is work for both
+    cpu_budget = os.cpu_count() or 1
+    if sys.platform == "win32":
+        # ProcessPoolExecutor rejects more than 61 workers on Windows
+        cpu_budget = min(cpu_budget, 61)
+    pool_workers = min(len(pool_files), cpu_budget if not vsd_files else cpu_budget // 2)
+    max_workers = max(1, pool_workers)
+    semaphore = asyncio.Semaphore(max(1, cpu_budget - pool_workers))
+    
+    def record(input_file, result):
+        results[input_file] = result
+        if progress:
+            progress.update(1)
+    
+    async def collect_from_pool(input_file, future):
+        record(input_file, await future)
+    
+    def run_on_loop(coro):
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+    
+    async def convert_vsd(input_file):
+        # The converter itself runs on this loop, so it shares the unoconv lock
+        async with semaphore:
+            result = await loop.run_in_executor(None, partial(
+                process_file, input_file, *targets[input_file], vsdx_support, vsd_support,
+                run=run_on_loop))
+        record(input_file, result)
+    
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker,
+                             initargs=(verbose,)) as executor:
+        # Submit the pool work before any thread (progress monitor, batch) starts,
+        # so workers are forked from a single-threaded process
+        tasks = []
+        for input_file in pool_files:
+            future = loop.run_in_executor(executor, process_file, input_file,
+                                          *targets[input_file], vsdx_support, vsd_support)
+            tasks.append(asyncio.ensure_future(collect_from_pool(input_file, future)))
+        
+        if PROGRESS_BAR_SUPPORT:
+            progress = tqdm(total=len(visio_files), desc="Converting", unit="file")
+        
+        # Run the blocking batch on a thread while the pool works, then retry
+        # its failures one file at a time as subprocesses on the event loop
+        if vsd_files:
+            batch_results, failed = await loop.run_in_executor(None, process_vsd_batch,
+                                                               vsd_files, targets)
+            for input_file, result in batch_results.items():
+                record(input_file, result)
+            tasks.extend(asyncio.ensure_future(convert_vsd(f)) for f in failed)
+        
+        await asyncio.gather(*tasks)
+    
+    if progress:
+        progress.close()
+    
+    return [results[input_file] for input_file in visio_files]
 
 def save_csv_report(results, save_path):
     """Save analysis report to CSV file"""
     fieldnames = ["filename", "output", "archive", "success", "time", "error"]
     
-    with open(save_path, 'w', newline='', encoding='utf-8') as csvfile:
+    # A large buffer turns the report into a handful of write calls
+    with open(save_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
-        for result in results:
-            writer.writerow(result)
+        writer.writerows(results)
     
     logging.info(f"CSV report saved to: {save_path}")
 
@@ -485,6 +993,8 @@ def main():
     parser = argparse.ArgumentParser(description=f"{APP_NAME} - Batch converter for Visio files to VDX format")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging")
     parser.add_argument("--no-report", action="store_true", help="Don't save CSV report")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="Skip files already converted in a previous run")
     args = parser.parse_args()
     
     # Setup logging
@@ -528,32 +1038,43 @@ def main():
         print(f"Please place Visio files (VSD, VSDX, VSDM, VDW) in the input folder: {INPUT_DIR}")
         return
     
+    # Snapshot existing names once instead of probing the disk per candidate name
+    used_names = {
+        OUTPUT_DIR: get_used_names(OUTPUT_DIR),
+        ARCHIVE_DIR: get_used_names(ARCHIVE_DIR)
+    }
+    
+    # Only retry files that were not converted by a previous run
+    if args.retry_failed:
+        converted = get_converted_filenames() | used_names[ARCHIVE_DIR]
+        pending = [f for f in visio_files if os.path.basename(f).lower() not in converted]
+        skipped = len(visio_files) - len(pending)
+        if skipped:
+            logging.info(f"Skipping {skipped} files already converted in a previous run")
+        visio_files = pending
+        
+        if not visio_files:
+            print("\nAll Visio files in the input directory were already converted.")
+            return
+    
     # Process files
     logging.info(f"Found {len(visio_files)} Visio files to process")
     print(f"\nFound {len(visio_files)} Visio files to process.")
     
-    results = []
-    
-    if PROGRESS_BAR_SUPPORT:
-        for input_file in tqdm(visio_files, desc="Converting", unit="file"):
-            result = process_file(input_file, vsdx_support, vsd_support)
-            results.append(result)
-    else:
-        for input_file in visio_files:
-            result = process_file(input_file, vsdx_support, vsd_support)
-            results.append(result)
+    results = process_files(visio_files, used_names, vsdx_support, vsd_support, args.verbose)
     
     # Print summary
     print_summary(results)
     
-    # Save CSV report
+    # Save CSV report (only ask when there is more than one file to review)
     if not args.no_report:
         save_csv = True
-        try:
-            save_response = input("Save detailed CSV report? [Y/n]: ").strip().lower()
-            save_csv = save_response != 'n'
-        except:
-            save_csv = True
+        if len(results) > 1:
+            try:
+                save_response = input("Save detailed CSV report? [Y/n]: ").strip().lower()
+                save_csv = save_response != 'n'
+            except:
+                save_csv = True
         
         if save_csv:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -568,6 +1089,7 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         logging.critical(f"Unhandled exception: {str(e)}")
-        logging.debug(traceback.format_exc())
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(traceback.format_exc())
         print(f"\nAn unexpected error occurred: {str(e)}")
         sys.exit(1)
\ No newline at end of file